@@ -1,27 +1,106 @@
 #!/usr/bin/env python3
 """Flask API server for the self-review frontend - stateless version."""
 
+import atexit
+import hashlib
+import json
 import logging
 import os
+import queue
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 
 from flask import Flask, jsonify, request, make_response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from pydantic_core import from_json, to_json
 from werkzeug.exceptions import HTTPException
 
+from .cache import TTLCache
 from .fetch_prs import fetch_merged_prs
+from .models import PULL_REQUEST_LIST_ADAPTER, PullRequest
 from .summarize_prs import load_secrets, summarize_prs_in_memory
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+# Configure logging. Records are handed to a background QueueListener so request
+# threads never block on writing to stderr. Set LOG_LEVEL=WARNING in production.
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
-)
+))
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+# getLevelName maps known level names to their number; anything else would make
+# setLevel raise and take the server down at import
+_valid_log_level = isinstance(logging.getLevelName(_log_level), int)
+logging.root.setLevel(_log_level if _valid_log_level else logging.INFO)
+logging.root.addHandler(QueueHandler(_log_queue))
 logger = logging.getLogger(__name__)
+if not _valid_log_level:
+    logger.warning("Unknown LOG_LEVEL %r, falling back to INFO", _log_level)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider using pydantic-core's Rust parser/serializer for request.json and jsonify."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return to_json(obj).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return from_json(s)
+
 
 app = Flask(__name__, static_folder='../frontend/dist', static_url_path='')
+app.json = FastJSONProvider(app)
 CORS(app)
 
+# Background summary jobs, polled via /api/jobs/<job_id>
+JOB_TTL_SECONDS = 60 * 60
+_job_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="summary-job")
+# Finished jobs, kept for JOB_TTL_SECONDS after completion. Running jobs live in
+# _pending_jobs instead so the LRU bound can never evict work that is still in progress.
+_jobs: TTLCache[Future] = TTLCache(maxsize=1024, ttl=JOB_TTL_SECONDS)
+_pending_jobs: dict[str, Future] = {}
+_pending_jobs_lock = threading.Lock()
+
+
+def _track_job(job_id: str, future: Future) -> None:
+    """Register a submitted job; it moves into the bounded _jobs cache once it finishes."""
+    with _pending_jobs_lock:
+        _pending_jobs[job_id] = future
+
+    def _on_done(done: Future) -> None:
+        # Store the result before dropping the pending entry so polls never see a gap
+        _jobs.set(job_id, done)
+        with _pending_jobs_lock:
+            _pending_jobs.pop(job_id, None)
+
+    future.add_done_callback(_on_done)
+
+
+def _get_job(job_id: str) -> Future | None:
+    """Look up a running or recently finished job."""
+    with _pending_jobs_lock:
+        future = _pending_jobs.get(job_id)
+    return future if future is not None else _jobs.get(job_id)
+
+# Generated summaries keyed by a hash of the PR set, year and role requirements
+SUMMARY_CACHE_TTL_SECONDS = 24 * 60 * 60
+_summary_cache: TTLCache[str] = TTLCache(maxsize=256, ttl=SUMMARY_CACHE_TTL_SECONDS)
+
+
+def summary_cache_key(prs: list[PullRequest], year: int, role_requirements: str) -> str:
+    """Build a content hash identifying a summarization request."""
+    sorted_prs = sorted(prs, key=lambda pr: pr.url)
+    canonical_prs = json.dumps(PULL_REQUEST_LIST_ADAPTER.dump_python(sorted_prs), sort_keys=True)
+    payload = json.dumps([canonical_prs, year, role_requirements])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
 
 def check_auth(username: str, password: str) -> bool:
     """Check if username/password combination is valid."""
@@ -47,13 +126,22 @@ def require_api_auth():
 @app.before_request
 def log_request_info():
     """Log incoming request details."""
-    logger.info("Request: %s %s", request.method, request.path)
+    logger.debug("Request: %s %s", request.method, request.path)
 
 
 @app.after_request
 def log_response_info(response):
     """Log response status."""
-    logger.info("Response: %s %s - %d", request.method, request.path, response.status_code)
+    logger.debug("Response: %s %s - %d", request.method, request.path, response.status_code)
+    return response
+
+
+# Vite emits content-hashed filenames under /assets, so browsers can keep them forever
+@app.after_request
+def cache_static_assets(response):
+    """Mark hashed frontend assets as immutable so repeat visits skip the server."""
+    if request.path.startswith('/assets/') and response.status_code == 200:
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
     return response
 
 
@@ -64,10 +152,109 @@ def serve_frontend():
     return app.send_static_file('index.html')
 
 
+class SummaryJobError(Exception):
+    """Raised by a summary job when fetching or summarizing fails."""
+
+
+def run_summary_job(
+    repos: list[str],
+    year: int,
+    github_username: str,
+    github_token: str,
+    role_requirements: str,
+    openai_api_key: str,
+) -> str:
+    """Fetch PRs for all repos and summarize them. Runs on the job executor.
+    
+    Returns:
+        Markdown formatted summary string
+        
+    Raises:
+        SummaryJobError: If fetching PRs or generating the summary fails
+    """
+    logger.info("Generating summary for %d repos/%d", len(repos), year)
+    
+    # Step 1: Fetch PRs from GitHub for all repos (in memory)
+    logger.debug("Fetching PRs from GitHub...")
+    all_prs: list[PullRequest] = []
+    repos_with_prs = []
+    
+    repo_results: dict[str, list[PullRequest]] = {}
+    with ThreadPoolExecutor(max_workers=min(len(repos), 8)) as executor:
+        futures = {
+            executor.submit(
+                fetch_merged_prs,
+                token=github_token,
+                username=github_username,
+                repo=repo,
+                year=year,
+            ): repo
+            for repo in repos
+        }
+        for future in as_completed(futures):
+            repo = futures[future]
+            try:
+                repo_results[repo] = future.result()
+            except Exception as e:
+                logger.error("Error fetching PRs from %s: %s", repo, str(e), exc_info=True)
+                for pending in futures:
+                    pending.cancel()
+                raise SummaryJobError(f"Error fetching PRs from {repo}: {str(e)}") from e
+    
+    # Merge in request order so the prompt is stable regardless of completion order,
+    # skipping PRs already seen (e.g. the same repo listed twice) to save LLM tokens
+    seen_urls: set[str] = set()
+    for repo in repos:
+        repo_prs = repo_results[repo]
+        if repo_prs:
+            for pr in repo_prs:
+                if pr.url not in seen_urls:
+                    seen_urls.add(pr.url)
+                    all_prs.append(pr)
+            repos_with_prs.append(repo)
+            logger.debug("Found %d PRs from %s", len(repo_prs), repo)
+        else:
+            logger.debug("No PRs found in %s", repo)
+    
+    if not all_prs:
+        logger.warning("No PRs found for %s in any repository for %d", github_username, year)
+        repos_str = ", ".join(f"**{repo}**" for repo in repos)
+        return f"# No PRs Found\n\nNo merged PRs found for user **{github_username}** in repositories {repos_str} for year **{year}**."
+    
+    logger.info("Found %d total PRs across %d repos, generating summary...", len(all_prs), len(repos_with_prs))
+    
+    # Step 2: Summarize PRs (in memory), reusing a cached summary for an identical request
+    cache_key = summary_cache_key(all_prs, year, role_requirements)
+    cached_summary = _summary_cache.get(cache_key)
+    if cached_summary is not None:
+        logger.info("Returning cached summary for %d PRs", len(all_prs))
+        return cached_summary
+    
+    logger.debug("Starting PR summarization with OpenAI...")
+    try:
+        summary = summarize_prs_in_memory(
+            prs=all_prs,
+            year=year,
+            openai_api_key=openai_api_key,
+            role_requirements=role_requirements,
+        )
+    except Exception as e:
+        logger.error("Error during summarization: %s", str(e), exc_info=True)
+        raise SummaryJobError(f"Error generating summary: {str(e)}") from e
+    
+    logger.info("Summarization complete, summary length: %d chars", len(summary))
+    _summary_cache.set(cache_key, summary)
+    return summary
+
+
 @app.route("/api/generate-summary", methods=["POST"])
 def generate_summary():
     """
-    Generate a self-review summary - fully stateless.
+    Start generating a self-review summary in the background.
+    
+    Input is validated synchronously; fetching PRs and calling OpenAI run on
+    the job executor so the request returns immediately. Poll
+    /api/jobs/<job_id> for the result.
     
     Expects JSON body:
     {
@@ -78,20 +265,21 @@ def generate_summary():
         "role_requirements": "# Job Requirements\\n..."
     }
     
-    Returns:
+    Returns (202):
     {
-        "summary": "# Performance Self-Review Summary...\\n..."
+        "job_id": "3f2b..."
     }
     """
     logger.info("=== Starting generate_summary endpoint ===")
     try:
-        logger.info("Parsing request JSON...")
+        logger.debug("Parsing request JSON...")
         data = request.json
         if data is None:
             logger.error("Request body is not valid JSON or empty")
             return jsonify({"error": "Request body must be valid JSON"}), 400
         
-        logger.info("Request data keys: %s", list(data.keys()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request data keys: %s", list(data.keys()))
         
         # Validate required fields
         required_fields = ["repos", "year", "github_username", "github_token", "role_requirements"]
@@ -110,66 +298,26 @@ def generate_summary():
         github_token = data["github_token"]
         role_requirements = data["role_requirements"]
         
-        logger.info("Validated input: repos=%s, year=%d, github_username=%s", repos, year, github_username)
+        logger.debug("Validated input: repos=%s, year=%d, github_username=%s", repos, year, github_username)
         
         # Load OpenAI API key from secrets.json
-        logger.info("Loading secrets...")
+        logger.debug("Loading secrets...")
         secrets = load_secrets()
         openai_api_key = secrets.openai_api_key
-        logger.info("Secrets loaded successfully")
-        
-        logger.info("Generating summary for %d repos/%d", len(repos), year)
+        logger.debug("Secrets loaded successfully")
         
-        # Step 1: Fetch PRs from GitHub for all repos (in memory)
-        logger.info("Fetching PRs from GitHub...")
-        all_prs = []
-        repos_with_prs = []
-        
-        for repo in repos:
-            logger.info("Fetching PRs from %s...", repo)
-            try:
-                repo_prs = fetch_merged_prs(
-                    token=github_token,
-                    username=github_username,
-                    repo=repo,
-                    year=year
-                )
-                if repo_prs:
-                    # Convert Pydantic models to dicts for summarize_prs_in_memory
-                    all_prs.extend([pr.model_dump() for pr in repo_prs])
-                    repos_with_prs.append(repo)
-                    logger.info("Found %d PRs from %s", len(repo_prs), repo)
-                else:
-                    logger.info("No PRs found in %s", repo)
-            except Exception as e:
-                logger.error("Error fetching PRs from %s: %s", repo, str(e), exc_info=True)
-                return jsonify({"error": f"Error fetching PRs from {repo}: {str(e)}"}), 500
-        
-        if not all_prs:
-            logger.warning("No PRs found for %s in any repository for %d", github_username, year)
-            repos_str = ", ".join(f"**{repo}**" for repo in repos)
-            return jsonify({
-                "summary": f"# No PRs Found\n\nNo merged PRs found for user **{github_username}** in repositories {repos_str} for year **{year}**."
-            })
-        
-        logger.info("Found %d total PRs across %d repos, generating summary...", len(all_prs), len(repos_with_prs))
-        
-        # Step 2: Summarize PRs (in memory)
-        logger.info("Starting PR summarization with OpenAI...")
-        try:
-            summary = summarize_prs_in_memory(
-                prs=all_prs,
-                year=year,
-                openai_api_key=openai_api_key,
-                role_requirements=role_requirements,
-            )
-            logger.info("Summarization complete, summary length: %d chars", len(summary))
-        except Exception as e:
-            logger.error("Error during summarization: %s", str(e), exc_info=True)
-            return jsonify({"error": f"Error generating summary: {str(e)}"}), 500
-        
-        logger.info("=== Summary generated successfully ===")
-        return jsonify({"summary": summary})
+        job_id = uuid.uuid4().hex
+        _track_job(job_id, _job_executor.submit(
+            run_summary_job,
+            repos=repos,
+            year=year,
+            github_username=github_username,
+            github_token=github_token,
+            role_requirements=role_requirements,
+            openai_api_key=openai_api_key,
+        ))
+        logger.info("=== Submitted summary job %s ===", job_id)
+        return jsonify({"job_id": job_id}), 202
         
     except ValueError as e:
         logger.error("Validation error: %s", str(e), exc_info=True)
@@ -179,6 +327,35 @@ def generate_summary():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    """
+    Poll a summary job started by /api/generate-summary.
+    
+    Returns:
+        202 {"status": "pending"} while the job is running,
+        200 {"status": "done", "summary": "..."} once finished,
+        500 {"status": "error", "error": "..."} if it failed,
+        404 if the job is unknown or has expired
+    """
+    future = _get_job(job_id)
+    if future is None:
+        return jsonify({"error": "Job not found"}), 404
+    if not future.done():
+        return jsonify({"status": "pending"}), 202
+    
+    try:
+        summary = future.result()
+    except SummaryJobError as e:
+        return jsonify({"status": "error", "error": str(e)}), 500
+    except Exception as e:
+        logger.error("Unexpected error in summary job %s: %s", job_id, str(e), exc_info=True)
+        return jsonify({"status": "error", "error": str(e)}), 500
+    
+    logger.info("=== Summary job %s completed ===", job_id)
+    return jsonify({"status": "done", "summary": summary})
+
+
 # HTTP error handler (for 4xx/5xx errors)
 @app.errorhandler(HTTPException)
 def handle_http_exception(e):
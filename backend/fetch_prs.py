@@ -1,121 +1,352 @@
 #!/usr/bin/env python3
 """Fetch merged PRs from a configured repository for a specified year."""
 
-import json
+import hashlib
+import logging
+import operator
 import os
 import requests
-from datetime import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 
-from .models import PullRequest
+from pydantic import TypeAdapter
+from requests.adapters import HTTPAdapter
+from typing_extensions import TypedDict
+from urllib3.util.retry import Retry
 
+from .cache import TTLCache, write_atomic
+from .models import PULL_REQUEST_LIST_ADAPTER, PullRequest
 
-def fetch_merged_prs(token: str, username: str, repo: str, year: int) -> list[PullRequest]:
-    """Fetch all PRs created by the user and merged in the specified year."""
-    url = f"https://api.github.com/repos/{repo}/pulls"
-    headers = {
-        "Authorization": f"token {token}",
-        "Accept": "application/vnd.github.v3+json",
+logger = logging.getLogger(__name__)
+
+
+# Shared session so connections (and TLS sessions) to api.github.com are reused
+# across pages, repos and requests. Auth headers are passed per call, never
+# stored on the session, since different users share it.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    ),
+)
+
+# REST search rather than GraphQL: GraphQL would trim unused fields, but its
+# cursor pagination is strictly sequential and POST responses carry no ETag,
+# so we would lose concurrent page fetches and 304 revalidation.
+SEARCH_URL = "https://api.github.com/search/issues"
+
+# ETag, body and last page of previously fetched pages, for conditional requests.
+# Bodies include users' private PR descriptions, so entries expire instead of
+# staying in server memory indefinitely.
+PAGE_CACHE_TTL_SECONDS = 60 * 60
+_PAGE_CACHE: TTLCache[tuple[str, bytes, int]] = TTLCache(maxsize=128, ttl=PAGE_CACHE_TTL_SECONDS)
+
+# GitHub's Search API returns at most 1000 results per query; larger date
+# ranges are split until each query fits
+SEARCH_RESULT_LIMIT = 1000
+
+# On-disk cache used by the CLI for PRs from past years
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "prs"
+
+# Pages fetched concurrently; kept small to stay clear of GitHub's secondary rate limits
+MAX_PAGE_WORKERS = 5
+
+# Longest we will sleep for a rate-limit reset before giving up on a request
+MAX_RATE_LIMIT_WAIT_SECONDS = 60
+MAX_RATE_LIMIT_RETRIES = 3
+
+
+class _RateLimiter:
+    """Thread-safe token bucket allowing max_calls requests per period seconds."""
+
+    def __init__(self, max_calls: int, period: float):
+        self._capacity = max_calls
+        self._rate = max_calls / period
+        self._tokens = float(max_calls)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+# The Search API allows 30 requests per minute per token, so each token gets its own
+# bucket; one user's large fetch must not stall other users. Buckets idle for an hour
+# are full again anyway, so evicting them is harmless.
+SEARCH_REQUESTS_PER_MINUTE = 30
+_SEARCH_LIMITERS: TTLCache[_RateLimiter] = TTLCache(maxsize=256, ttl=60 * 60)
+_SEARCH_LIMITERS_LOCK = threading.Lock()
+
+
+def _get_search_limiter(token_key: str) -> _RateLimiter:
+    """Return the Search API rate limiter for a token, keyed by the token's hash."""
+    with _SEARCH_LIMITERS_LOCK:
+        limiter = _SEARCH_LIMITERS.get(token_key)
+        if limiter is None:
+            limiter = _RateLimiter(max_calls=SEARCH_REQUESTS_PER_MINUTE, period=60)
+            _SEARCH_LIMITERS.set(token_key, limiter)
+        return limiter
+
+
+def _parse_retry_after(value: str) -> float | None:
+    """Parse a Retry-After header given as seconds or an HTTP date; None if unparseable."""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0)
+
+
+def _rate_limit_wait(response: requests.Response) -> float | None:
+    """Return how long GitHub asked us to wait, or None if this is not a rate-limit response."""
+    if response.status_code not in (403, 429):
+        return None
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        wait = _parse_retry_after(retry_after)
+        if wait is not None:
+            return wait
+    if response.headers.get("X-RateLimit-Remaining") == "0":
+        reset_at = float(response.headers.get("X-RateLimit-Reset", time.time()))
+        return max(reset_at - time.time(), 0) + 1
+    return None
+
+
+def _get_last_page(response: requests.Response) -> int:
+    """Read the total page count from the Link header, or 1 if there is no next page."""
+    last_url = response.links.get("last", {}).get("url")
+    if not last_url:
+        return 1
+    page_values = parse_qs(urlparse(last_url).query).get("page")
+    return int(page_values[0]) if page_values else 1
+
+
+def _fetch_page(headers: dict[str, str], query: str, page: int, per_page: int) -> tuple[bytes, int]:
+    """Fetch a single page of search results.
+    
+    Sends If-None-Match with the ETag from a previous fetch of the same page so
+    GitHub can answer 304 Not Modified, which does not count against the rate limit.
+    
+    Returns:
+        The raw JSON body and the last page number from the Link header
+    """
+    params = {
+        "q": query,
+        "per_page": per_page,
+        "page": page,
     }
+    token_key = hashlib.sha256(headers["Authorization"].encode("utf-8")).hexdigest()
+    # Key includes the token hash so cached pages are never shared between tokens
+    cache_key = hashlib.sha256(f"{token_key}\0{query}\0{page}\0{per_page}".encode("utf-8")).hexdigest()
+    limiter = _get_search_limiter(token_key)
+    cached = _PAGE_CACHE.get(cache_key)
     
-    all_prs = []
-    page = 1
-    per_page = 100
+    request_headers = headers
+    if cached is not None:
+        request_headers = {**headers, "If-None-Match": cached[0]}
     
-    # Date range for the specified year
-    start_date = datetime(year, 1, 1)
-    end_date = datetime(year, 12, 31, 23, 59, 59)
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        limiter.acquire()
+        response = _SESSION.get(SEARCH_URL, headers=request_headers, params=params, timeout=30)
+        wait = _rate_limit_wait(response)
+        if wait is None or wait > MAX_RATE_LIMIT_WAIT_SECONDS or attempt == MAX_RATE_LIMIT_RETRIES:
+            break
+        logger.warning(
+            "GitHub rate limit hit on page %d (remaining=%s), retrying in %.1fs",
+            page, response.headers.get("X-RateLimit-Remaining"), wait,
+        )
+        time.sleep(wait)
     
-    # Early exit: stop after finding user's PRs all before target year
-    consecutive_old_pages = 0
-    max_consecutive_old_pages = 1
+    if response.status_code == 304 and cached is not None:
+        _, content, last_page = cached
+        return content, last_page
+    response.raise_for_status()
     
-    print(f"Fetching merged PRs for {username} from {repo}...")
+    last_page = _get_last_page(response)
+    etag = response.headers.get("ETag")
+    if etag:
+        _PAGE_CACHE.set(cache_key, (etag, response.content, last_page))
+    return response.content, last_page
+
+
+class _SearchLabel(TypedDict):
+    name: str
+
+
+class _SearchPullRequest(TypedDict):
+    merged_at: str
+
+
+class _SearchItem(TypedDict):
+    title: str
+    body: str | None
+    html_url: str
+    pull_request: _SearchPullRequest
+    labels: list[_SearchLabel]
+
+
+class _SearchPage(TypedDict):
+    total_count: int
+    items: list[_SearchItem]
+
+
+# Decodes a search page keeping only the fields we read; the many other fields on
+# each item (user, reactions, URLs...) are skipped instead of built into dicts
+_SEARCH_PAGE_ADAPTER = TypeAdapter(_SearchPage)
+
+_get_name = operator.itemgetter("name")
+
+
+def _process_page(items: list[_SearchItem], page: int, repo: str, all_prs: list[PullRequest]) -> None:
+    """Convert one page of search results into PullRequest models."""
+    page_example_printed = False
     
-    while True:
-        params = {
-            "state": "closed",
-            "per_page": per_page,
-            "page": page,
-        }
+    for item in items:
+        # GitHub's response is trusted, so build the dataclass directly without validation
+        pr_data = PullRequest(
+            title=item["title"],
+            description=item["body"] or "",
+            url=item["html_url"],
+            merged_at=item["pull_request"]["merged_at"],
+            labels=list(map(_get_name, item["labels"])),
+            source_repo=repo,
+        )
+        all_prs.append(pr_data)
         
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
-        
-        prs = response.json()
-        if not prs:
-            break
-        
-        page_example_printed = False
-        found_match_this_page = False
-        found_old_user_pr = False  # Track if user has PRs merged before target year
-        
-        for pr in prs:
-            # Skip if not merged
-            if not pr.get("merged_at"):
-                continue
-            
-            # Skip early if not created by the target user
-            author = pr.get("user", {})
-            if not author or author.get("login", "").lower() != username.lower():
-                continue
-            
-            # Parse merge date
-            merged_at = datetime.fromisoformat(pr["merged_at"].replace("Z", "+00:00"))
-            merged_at_naive = merged_at.replace(tzinfo=None)
-            
-            # Check if PR is before target year (too old)
-            if merged_at_naive < start_date:
-                found_old_user_pr = True
-                continue
-            
-            # Check if PR is after target year (too new)
-            if merged_at_naive > end_date:
-                continue
-            
-            # Found a matching PR in the target year
-            found_match_this_page = True
-            
-            pr_data = PullRequest(
-                title=pr["title"],
-                description=pr.get("body") or "",
-                url=pr["html_url"],
-                merged_at=pr["merged_at"],
-                labels=[label["name"] for label in pr.get("labels", [])],
-                source_repo=repo,
+        # Log first PR on each page as example
+        if not page_example_printed and logger.isEnabledFor(logging.DEBUG):
+            page_example_printed = True
+            desc = pr_data.description
+            logger.debug(
+                "Example PR from page %d:\n    Title: %s\n    URL: %s\n    Merged: %s\n    Labels: %s\n    Description: %s",
+                page, pr_data.title, pr_data.url, pr_data.merged_at, pr_data.labels,
+                f"{desc[:100]}..." if len(desc) > 100 else desc,
             )
-            all_prs.append(pr_data)
-            
-            # Print first matching PR on each page as example
-            if not page_example_printed:
-                page_example_printed = True
-                print(f"\n  Example PR from page {page}:")
-                print(f"    Title: {pr_data.title}")
-                print(f"    URL: {pr_data.url}")
-                print(f"    Merged: {pr_data.merged_at}")
-                print(f"    Labels: {pr_data.labels}")
-                desc = pr_data.description
-                print(f"    Description: {desc[:100]}..." if len(desc) > 100 else f"    Description: {desc}")
-        
-        print(f"  Processed page {page} ({len(prs)} PRs)")
-        
-        # Early exit: if no matches found and user has PRs from before target year
-        if not found_match_this_page and found_old_user_pr:
-            consecutive_old_pages += 1
-            print(f"  No matches, found old PRs from {username} ({consecutive_old_pages}/{max_consecutive_old_pages})")
-            if consecutive_old_pages >= max_consecutive_old_pages:
-                print(f"  Stopping early - past target year range for {username}")
-                break
-        elif found_match_this_page:
-            consecutive_old_pages = 0  # Reset counter when we find matches
-        
-        page += 1
+    
+    logger.debug("Processed page %d (%d PRs)", page, len(items))
+
+
+def _get_cache_path(cache_dir: Path, username: str, repo: str, year: int) -> Path:
+    """Location of the on-disk PR cache for one user/repo/year."""
+    return cache_dir / repo.replace("/", "__") / username.lower() / f"{year}.json"
+
+
+def _fetch_merged_range(
+    headers: dict,
+    base_query: str,
+    start: date,
+    end: date,
+    per_page: int,
+    repo: str,
+    all_prs: list[PullRequest],
+) -> None:
+    """Fetch search results for PRs merged between start and end (inclusive) into all_prs.
+    
+    If more PRs match than the Search API will return, the range is split in
+    half and each half is fetched separately, so no results are cut off unless
+    a single day alone exceeds the limit.
+    """
+    query = f"{base_query} merged:{start.isoformat()}..{end.isoformat()}"
+    first_content, last_page = _fetch_page(headers, query, 1, per_page)
+    first_page = _SEARCH_PAGE_ADAPTER.validate_json(first_content)
+    total_count = first_page["total_count"]
+    if total_count > SEARCH_RESULT_LIMIT:
+        if start < end:
+            mid = start + (end - start) // 2
+            logger.info(
+                "%d PRs match in %s for %s..%s; splitting the date range",
+                total_count, repo, start, end,
+            )
+            _fetch_merged_range(headers, base_query, start, mid, per_page, repo, all_prs)
+            _fetch_merged_range(headers, base_query, mid + timedelta(days=1), end, per_page, repo, all_prs)
+            return
+        logger.warning(
+            "%d PRs match in %s on %s but the Search API only returns the first %d",
+            total_count, repo, start, SEARCH_RESULT_LIMIT,
+        )
+    
+    _process_page(first_page["items"], 1, repo, all_prs)
+    
+    if last_page > 1:
+        pages = range(2, last_page + 1)
+        with ThreadPoolExecutor(max_workers=MAX_PAGE_WORKERS) as executor:
+            results = executor.map(lambda p: _fetch_page(headers, query, p, per_page), pages)
+            for page, (content, _) in zip(pages, results):
+                _process_page(_SEARCH_PAGE_ADAPTER.validate_json(content)["items"], page, repo, all_prs)
+
+
+def fetch_merged_prs(
+    token: str,
+    username: str,
+    repo: str,
+    year: int,
+    cache_dir: Path | None = None,
+) -> list[PullRequest]:
+    """Fetch all PRs created by the user and merged in the specified year.
+    
+    Uses the Search API so GitHub filters by author and merge date server-side.
+    Page 1 is fetched first to learn the total page count from the Link header;
+    the remaining pages are then fetched concurrently. Years with more matches
+    than the Search API returns are fetched as smaller date ranges.
+    
+    If cache_dir is given, results for past years (whose merged PRs no longer
+    change) are stored there and reused on later calls without hitting GitHub.
+    """
+    cache_path = None
+    if cache_dir is not None and year < datetime.now(timezone.utc).year:
+        cache_path = _get_cache_path(cache_dir, username, repo, year)
+        if cache_path.exists():
+            logger.info("Loading cached PRs for %s from %s (%s)", username, repo, cache_path)
+            return PULL_REQUEST_LIST_ADAPTER.validate_json(cache_path.read_bytes())
+    
+    headers = {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github.v3+json",
+    }
+    per_page = 100
+    
+    logger.info("Fetching merged PRs for %s from %s...", username, repo)
+    
+    all_prs: list[PullRequest] = []
+    _fetch_merged_range(
+        headers, f"repo:{repo} is:pr is:merged author:{username}",
+        date(year, 1, 1), date(year, 12, 31), per_page, repo, all_prs,
+    )
+    
+    if cache_path is not None:
+        write_atomic(cache_path, PULL_REQUEST_LIST_ADAPTER.dump_json(all_prs))
     
     return all_prs
 
 
 def main():
     """Interactive CLI for fetching PRs during development."""
+    # Show per-page progress and example PRs while developing
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logger.setLevel(logging.DEBUG)
+    
     print("=== Fetch Merged PRs (Dev Mode) ===\n")
     
     # Prompt for inputs
@@ -145,15 +376,14 @@ def main():
         return
     
     print()
-    prs = fetch_merged_prs(token, username, repo, year)
+    prs = fetch_merged_prs(token, username, repo, year, cache_dir=CACHE_DIR)
     
     # Sort by merge date
     prs.sort(key=lambda x: x.merged_at)
     
-    # Write output to project root (convert Pydantic models to dicts for JSON serialization)
+    # Write output to project root, serializing straight from the models in one pass
     output_path = Path(__file__).parent.parent / f"merged_prs_{year}.json"
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump([pr.model_dump() for pr in prs], f, indent=2)
+    output_path.write_bytes(PULL_REQUEST_LIST_ADAPTER.dump_json(prs, indent=2))
     
     print(f"\nFound {len(prs)} merged PRs in {year}")
     print(f"Output written to {output_path}")
@@ -1,20 +1,32 @@
 #!/usr/bin/env python3
 """Shared data models for the self-review application."""
 
-from pydantic import BaseModel
+from dataclasses import dataclass, field
 
+from pydantic import TypeAdapter
 
-class PullRequest(BaseModel):
-    """Model representing a merged pull request."""
+
+@dataclass(slots=True, frozen=True)
+class PullRequest:
+    """A merged pull request.
+    
+    A plain slotted dataclass rather than a Pydantic model: PRs are created in
+    bulk from trusted GitHub data and only read afterwards, so per-instance
+    validation is not needed. Untrusted JSON is still validated through
+    PULL_REQUEST_LIST_ADAPTER.
+    """
     title: str
     description: str
     url: str
     merged_at: str
     labels: list[str]
     source_repo: str = ""
+    # Date portion of merged_at, computed once at construction; not serialized
+    merged_date: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "merged_date", self.merged_at[:10])
 
-    @property
-    def merged_date(self) -> str:
-        """Extract the date portion from merged_at timestamp."""
-        return self.merged_at[:10]
 
+# Validates/serializes a whole list of PRs in one pydantic-core call
+PULL_REQUEST_LIST_ADAPTER = TypeAdapter(list[PullRequest])
@@ -1,24 +1,20 @@
 """Prompts for LLM summarization tasks."""
 
 
-def get_summarize_prompt(
-    num_prs: int,
-    year: int,
-    job_requirements: str,
-    prs_text: str,
-) -> str:
-    """Generate the prompt for summarizing PRs.
+def get_summarize_system_prompt(job_requirements: str) -> str:
+    """Generate the system prompt for summarizing PRs.
+    
+    This prompt only depends on the job requirements so it forms an identical
+    prefix across requests, which lets OpenAI's prompt caching reuse it. Do not
+    add per-request values (PR counts, years, usernames, timestamps) here.
     
     Args:
-        num_prs: Number of PRs being summarized
-        year: The year for the summary
         job_requirements: The job requirements text
-        prs_text: Formatted PRs text
         
     Returns:
-        The formatted prompt string
+        The formatted system prompt string
     """
-    return f"""You are helping an engineer write their performance self-review. Below are {num_prs} pull requests they merged in {year}.
+    return f"""You are helping an engineer write their performance self-review. The user message lists pull requests they merged during the review year.
 
 JOB REQUIREMENTS:
 {job_requirements}
@@ -31,8 +27,48 @@ Analyze these PRs and summarize the key themes, accomplishments, and impact into
 
 Be specific but concise. Use action verbs. Quantify impact where possible. When describing significance, explicitly connect the work to the job requirements.
 
-For each bullet point, cite the relevant PRs that support that point. Include the PR title and URL for each citation. A bullet point can cite one or more PRs.
+For each bullet point, cite the relevant PRs that support that point. Include the PR title and URL for each citation. A bullet point can cite one or more PRs."""
+
+
+def get_summarize_user_prompt(
+    num_prs: int,
+    year: int,
+    prs_text: str,
+) -> str:
+    """Generate the per-request user prompt listing the PRs to summarize.
+    
+    Args:
+        num_prs: Number of PRs being summarized
+        year: The year for the summary
+        prs_text: PRs formatted as a JSON array
+        
+    Returns:
+        The formatted user prompt string
+    """
+    return f"""Below are {num_prs} pull requests merged in {year}, as a JSON array of objects with "title", "description", "merged" (merge date) and "url" fields.
 
 PRs:
 {prs_text}"""
 
+
+def get_batched_summarize_user_prompt(
+    num_groups: int,
+    year: int,
+    groups_text: str,
+) -> str:
+    """Generate the user prompt for summarizing several label groups in one call.
+    
+    Args:
+        num_groups: Number of label groups being summarized
+        year: The year for the summary
+        groups_text: JSON array of PRs for each group, each under a "# LABEL: <name>" heading
+        
+    Returns:
+        The formatted user prompt string
+    """
+    return f"""Below are {num_groups} groups of pull requests merged in {year}, each under a "# LABEL: <name>" heading. Each group's PRs are a JSON array of objects with "title", "description", "merged" (merge date) and "url" fields.
+
+Summarize each group separately, as if it were the only set of PRs provided. Return exactly one entry per group with its label copied verbatim, and only cite PRs from that group.
+
+GROUPS:
+{groups_text}"""
@@ -1,37 +1,74 @@
 #!/usr/bin/env python3
 """Summarize merged PRs by label using LLM for performance self-review."""
 
+import functools
+import hashlib
+import io
 import json
 import logging
+import operator
 import os
+import re
 import time
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Annotated, Callable, TypeVar
 
 logger = logging.getLogger(__name__)
 
 from openai import OpenAI
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_json
+from typing_extensions import TypedDict
 
-from .models import PullRequest
-from .prompts import get_summarize_prompt
+from .cache import write_atomic
+from .models import PULL_REQUEST_LIST_ADAPTER, PullRequest
+from .prompts import (
+    get_batched_summarize_user_prompt,
+    get_summarize_system_prompt,
+    get_summarize_user_prompt,
+)
 
 
-class PRCitation(BaseModel):
+# OpenAI model and per-call output budget for summaries; both are part of the response cache key
+SUMMARY_MODEL = "gpt-5.2"
+MAX_COMPLETION_TOKENS = 16384
+
+# Concurrent OpenAI calls in the CLI; kept modest to stay within RPM limits
+MAX_SUMMARY_WORKERS = 10
+
+# The CLI packs label groups into as few LLM calls as possible, capped at this many
+# PRs (input size) and labels (output size) per call
+BATCH_MAX_PRS = 150
+BATCH_MAX_LABELS = 8
+
+# Longer PR descriptions are truncated in prompts; titles carry most of the signal
+MAX_DESCRIPTION_CHARS = 1500
+TRUNCATION_MARKER = "… [truncated]"
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+# Raw LLM responses keyed by prompt hash, so CLI reruns on unchanged PRs skip the call
+RESPONSE_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "summaries"
+RESPONSE_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+T = TypeVar("T")
+
+
+# A TypedDict rather than a model: citations are small leaves, so they are validated
+# in place as dicts instead of being built into model instances
+class PRCitation(TypedDict):
     """A PR citation with title and URL."""
-    model_config = ConfigDict(
-        json_schema_extra={
-            "additionalProperties": False
-        }
-    )
+    __pydantic_config__ = ConfigDict(extra="forbid")  # type: ignore[misc]
     
-    title: str = Field(description="The title of the PR")
-    url: str = Field(description="The GitHub PR URL")
+    title: Annotated[str, Field(description="The title of the PR")]
+    url: Annotated[str, Field(description="The GitHub PR URL")]
 
 
 class SummaryBullet(BaseModel):
     """A single summary bullet point with citations."""
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "additionalProperties": False
         }
@@ -47,6 +84,7 @@ class SummaryBullet(BaseModel):
 class SummaryResponse(BaseModel):
     """Structured response containing summary bullet points with citations."""
     model_config = ConfigDict(
+        frozen=True,
         json_schema_extra={
             "additionalProperties": False
         }
@@ -55,6 +93,54 @@ class SummaryResponse(BaseModel):
     bullets: list[SummaryBullet] = Field(description="List of summary bullet points")
 
 
+class LabeledSummary(BaseModel):
+    """Summary bullets for one label group within a batched response."""
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
+            "additionalProperties": False
+        }
+    )
+    
+    label: str = Field(description="The label of the PR group these bullets summarize, exactly as given")
+    bullets: list[SummaryBullet] = Field(description="List of summary bullet points for this label")
+
+
+class BatchedSummaryResponse(BaseModel):
+    """Structured response summarizing several label groups in one call."""
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
+            "additionalProperties": False
+        }
+    )
+    
+    summaries: list[LabeledSummary] = Field(description="One summary per label group, in the order given")
+
+
+# Schema generation walks the whole model tree, so build it once at import
+_SUMMARY_JSON_SCHEMA = SummaryResponse.model_json_schema()
+_BATCHED_SUMMARY_JSON_SCHEMA = BatchedSummaryResponse.model_json_schema()
+
+
+def _json_schema_response_format(name: str, schema: dict) -> dict:
+    """Build a strict structured-outputs response_format for the chat completions API."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": name,
+            "schema": schema,
+            "strict": True,
+        },
+    }
+
+
+_SUMMARY_RESPONSE_FORMAT = _json_schema_response_format("summary_response", _SUMMARY_JSON_SCHEMA)
+_BATCHED_SUMMARY_RESPONSE_FORMAT = _json_schema_response_format(
+    "batched_summary_response", _BATCHED_SUMMARY_JSON_SCHEMA
+)
+
+
 class Secrets(BaseModel):
     openai_api_key: str
 
@@ -63,9 +149,20 @@ def load_prs(year: int) -> list[PullRequest]:
     """Load merged PRs from JSON file."""
     # Files are in project root, one level up from backend/
     prs_path = Path(__file__).parent.parent / f"merged_prs_{year}.json"
-    with open(prs_path, encoding="utf-8") as f:
-        data = json.load(f)
-    return [PullRequest.model_validate(pr) for pr in data]
+    # Parse and validate the whole file in a single pydantic-core pass
+    return PULL_REQUEST_LIST_ADAPTER.validate_json(prs_path.read_bytes())
+
+
+@functools.lru_cache(maxsize=8)
+def _read_file_cached(path: str, mtime_ns: int) -> bytes:
+    """Read a file's bytes. The mtime is part of the cache key so edits invalidate it."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _read_file(path: Path) -> bytes:
+    """Read a file, reusing the cached contents while it is unchanged on disk."""
+    return _read_file_cached(str(path), path.stat().st_mtime_ns)
 
 
 def load_secrets() -> Secrets:
@@ -78,8 +175,7 @@ def load_secrets() -> Secrets:
     # Fall back to secrets.json (for local development)
     secrets_path = Path(__file__).parent.parent / "secrets.json"
     if secrets_path.exists():
-        with open(secrets_path, encoding="utf-8") as f:
-            return Secrets.model_validate(json.load(f))
+        return Secrets.model_validate_json(_read_file(secrets_path))
     
     raise ValueError("OPENAI_API_KEY environment variable or secrets.json file required")
 
@@ -88,106 +184,195 @@ def load_job_requirements() -> str:
     """Load job requirements content from role_requirements.md."""
     # role_requirements.md is in project root, one level up from backend/
     job_requirements_path = Path(__file__).parent.parent / "role_requirements.md"
-    with open(job_requirements_path, encoding="utf-8") as f:
-        return f.read()
+    return _read_file(job_requirements_path).decode("utf-8")
 
 
 def format_summary_with_citations(summary_response: SummaryResponse) -> str:
     """Format summary response into markdown with citations, grouped by career area."""
     # Group bullets by career area
-    grouped_by_area: dict[str, list[SummaryBullet]] = defaultdict(list)
+    grouped_by_area: dict[str, list[SummaryBullet]] = {}
+    setdefault = grouped_by_area.setdefault
     for bullet in summary_response.bullets:
-        grouped_by_area[bullet.career_area].append(bullet)
+        setdefault(bullet.career_area, []).append(bullet)
     
     # Sort career areas alphabetically for consistent output
     sorted_areas = sorted(grouped_by_area.keys())
     
-    lines = []
+    buf = io.StringIO()
+    write = buf.write
     for area in sorted_areas:
-        lines.append(f"### {area}")
-        lines.append("")
-        for i, bullet in enumerate(grouped_by_area[area]):
-            lines.append(f"- **{bullet.title}**")
-            lines.append("")
-            lines.append(f"  **Work Done:** {bullet.work_done}")
-            lines.append("")
-            lines.append("  **Cited PRs:**")
-            for citation in bullet.pr_citations:
-                lines.append(f"  - [{citation.title}]({citation.url})")
-            lines.append("")
-            lines.append("  **Significance:**")
-            lines.append(f"  {bullet.significance}")
-            if i < len(grouped_by_area[area]) - 1:
-                lines.append("")
-        lines.append("")
+        write(f"### {area}\n\n")
+        bullets = grouped_by_area[area]
+        for i, bullet in enumerate(bullets):
+            write(f"- **{bullet.title}**\n\n  **Work Done:** {bullet.work_done}\n\n  **Cited PRs:**\n")
+            buf.writelines(f"  - [{citation['title']}]({citation['url']})\n" for citation in bullet.pr_citations)
+            write(f"\n  **Significance:**\n  {bullet.significance}\n")
+            if i < len(bullets) - 1:
+                write("\n")
+        write("\n")
     
-    return "\n".join(lines)
+    # Areas are separated, not terminated, by a blank line
+    return buf.getvalue()[:-1]
 
 
 def group_prs_by_label(prs: list[PullRequest]) -> dict[str, list[PullRequest]]:
-    """Group PRs by their labels. Unlabeled PRs are grouped by source_repo."""
-    grouped: dict[str, list[PullRequest]] = defaultdict(list)
+    """Group PRs by label. Unlabeled PRs are grouped by source_repo.
+    
+    Each PR goes into exactly one group, its alphabetically first label, so a
+    PR with several labels is only sent to the LLM once.
+    """
+    grouped: dict[str, list[PullRequest]] = {}
+    setdefault = grouped.setdefault
     for pr in prs:
-        if pr.labels:
-            for label in pr.labels:
-                grouped[label].append(pr)
-        else:
-            grouped[pr.source_repo or "unlabeled"].append(pr)
-    return dict(grouped)
+        labels = pr.labels
+        key = min(labels) if labels else (pr.source_repo or "unlabeled")
+        setdefault(key, []).append(pr)
+    return grouped
+
+
+def pack_label_batches(grouped: dict[str, list[PullRequest]]) -> list[list[str]]:
+    """Greedily pack labels, in sorted order, into batches for a single LLM call each.
+    
+    A batch is closed once adding the next label would exceed BATCH_MAX_PRS or
+    BATCH_MAX_LABELS. A label larger than BATCH_MAX_PRS gets a batch to itself.
+    """
+    batches: list[list[str]] = []
+    batch: list[str] = []
+    batch_prs = 0
+    for label in sorted(grouped):
+        num_prs = len(grouped[label])
+        if batch and (batch_prs + num_prs > BATCH_MAX_PRS or len(batch) >= BATCH_MAX_LABELS):
+            batches.append(batch)
+            batch, batch_prs = [], 0
+        batch.append(label)
+        batch_prs += num_prs
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def compact_description(description: str) -> str:
+    """Shrink a PR description for the prompt.
+    
+    Drops HTML comments (usually unfilled PR template hints) and collapses runs
+    of blank lines without changing the text. Descriptions still longer than
+    MAX_DESCRIPTION_CHARS are truncated, losing whatever follows the cut (e.g.
+    trailing testing or impact sections), and end with TRUNCATION_MARKER so the
+    model knows the text is incomplete.
+    """
+    if "<!--" in description:
+        description = _HTML_COMMENT_RE.sub("", description)
+    description = _BLANK_LINES_RE.sub("\n\n", description.strip())
+    if len(description) > MAX_DESCRIPTION_CHARS:
+        description = description[:MAX_DESCRIPTION_CHARS].rstrip() + TRUNCATION_MARKER
+    return description
 
 
 def format_prs_for_prompt(prs: list[PullRequest]) -> str:
-    """Format PRs into a string for the LLM prompt."""
-    lines = []
-    for pr in prs:
-        lines.append(f"## {pr.title}")
-        if pr.description:
-            lines.append(pr.description)
-        lines.append(f"Merged: {pr.merged_date}")
-        lines.append(f"URL: {pr.url}")
-        lines.append("")
-    return "\n".join(lines)
+    """Format PRs as a compact JSON array for the LLM prompt."""
+    # Serialized in one pydantic-core pass instead of concatenating per-PR strings
+    return to_json([
+        {
+            "title": pr.title,
+            "description": compact_description(pr.description) if pr.description else "",
+            "merged": pr.merged_date,
+            "url": pr.url,
+        }
+        for pr in prs
+    ]).decode("utf-8")
 
 
-def generate_summary(
-    client: OpenAI,
-    prs: list[PullRequest],
-    year: int,
-    job_requirements: str,
-    max_retries: int = 3,
-) -> SummaryResponse:
-    """Summarize all PRs into high-level bullet points with citations, grouped by job requirements areas."""
-    prs_text = format_prs_for_prompt(prs)
-    pr_urls = [pr.url for pr in prs]
+class CitationError(ValueError):
+    """The LLM cited a URL that is not one of the provided PRs."""
 
-    prompt = get_summarize_prompt(
-        num_prs=len(prs),
-        year=year,
-        job_requirements=job_requirements,
-        prs_text=prs_text,
-    )
+
+class TruncatedResponseError(ValueError):
+    """The LLM hit max_completion_tokens before finishing its JSON response."""
+
+
+def _validate_citations(bullets: list[SummaryBullet], all_urls: frozenset[str]) -> None:
+    """Raise CitationError on the first bullet citing a URL outside the provided PRs."""
+    for bullet in bullets:
+        for citation in bullet.pr_citations:
+            if citation["url"] not in all_urls:
+                raise CitationError(f"Cited URL {citation['url']} is not in the provided PRs")
+
+
+def _create_structured_completion(
+    client: OpenAI,
+    system_prompt: str,
+    user_prompt: str,
+    response_format: dict,
+    parse: Callable[[str], T],
+    max_retries: int,
+    cache_dir: Path | None = None,
+) -> T:
+    """Request a strict JSON-schema completion, retrying with exponential backoff.
+    
+    Args:
+        client: OpenAI client
+        system_prompt: Static instructions, sent first so the prefix can be cached
+        user_prompt: Per-request payload
+        response_format: Prebuilt json_schema response_format the response must follow
+        parse: Converts the response content into the result; raising triggers a
+            retry, except CitationError which is raised immediately. A response
+            cut off at the token limit raises TruncatedResponseError immediately.
+        max_retries: Maximum number of attempts
+        cache_dir: If set, reuse a response cached here for an identical request
+            (younger than RESPONSE_CACHE_TTL_SECONDS) and cache new responses
+        
+    Returns:
+        The parsed result
+    """
+    prompt_cache_key = hashlib.sha256(system_prompt.encode("utf-8")).hexdigest()
+
+    cache_path = None
+    if cache_dir is not None:
+        # Everything that shapes the response is part of the key, so a changed schema,
+        # model or token budget never replays a response generated under the old one
+        request_hash = hashlib.sha256(
+            "\0".join((
+                SUMMARY_MODEL,
+                str(MAX_COMPLETION_TOKENS),
+                json.dumps(response_format, sort_keys=True),
+                system_prompt,
+                user_prompt,
+            )).encode("utf-8")
+        ).hexdigest()
+        cache_path = cache_dir / f"{request_hash}.json"
+        try:
+            if time.time() - cache_path.stat().st_mtime < RESPONSE_CACHE_TTL_SECONDS:
+                result = parse(cache_path.read_text(encoding="utf-8"))
+                logger.info(f"Using cached LLM response {cache_path.name}")
+                return result
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unusable cached response {cache_path.name}: {e}")
 
     last_error: Exception | None = None
     for attempt in range(max_retries):
         try:
             # Use OpenAI's structured outputs API with Pydantic model (stable API)
             response = client.chat.completions.create(  # type: ignore[call-overload]
-                model="gpt-5.2",
-                max_completion_tokens=16384,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "summary_response",
-                        "schema": SummaryResponse.model_json_schema(),
-                        "strict": True,
-                    },
-                },
+                model=SUMMARY_MODEL,
+                max_completion_tokens=MAX_COMPLETION_TOKENS,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt},
+                ],
+                prompt_cache_key=prompt_cache_key,
+                response_format=response_format,
             )
 
             content = response.choices[0].message.content
             finish_reason = response.choices[0].finish_reason
             
+            if finish_reason == "length":
+                raise TruncatedResponseError(
+                    "LLM response hit the completion token limit; the request needs to be smaller"
+                )
+            
             if not content:
                 logger.warning(
                     f"Empty response (attempt {attempt + 1}/{max_retries}), "
@@ -195,18 +380,19 @@ def generate_summary(
                 )
                 raise ValueError(f"Empty response from LLM (finish_reason={finish_reason})")
             
-            # Parse JSON response into Pydantic model
-            summary = SummaryResponse.model_validate_json(content)
-            
-            # Validate that all cited URLs are from the provided PRs
-            all_urls = set(pr_urls)
-            for bullet in summary.bullets:
-                for citation in bullet.pr_citations:
-                    if citation.url not in all_urls:
-                        raise ValueError(f"Cited URL {citation.url} is not in the provided PRs")
-            
-            return summary
+            result = parse(content)
+            if cache_path is not None:
+                # A failed cache write must not discard a good response and trigger a retry
+                try:
+                    write_atomic(cache_path, content.encode("utf-8"))
+                except OSError as e:
+                    logger.warning(f"Could not cache LLM response {cache_path.name}: {e}")
+            return result
             
+        except (CitationError, TruncatedResponseError):
+            # The same prompt tends to fail the same way (same off-corpus citation,
+            # same output length), so retrying would only spend more slow calls
+            raise
         except Exception as e:
             last_error = e
             if attempt < max_retries - 1:
@@ -217,11 +403,124 @@ def generate_summary(
     raise ValueError(f"Failed to generate summary after {max_retries} attempts: {last_error}")
 
 
+def generate_summary(
+    client: OpenAI,
+    prs: list[PullRequest],
+    year: int,
+    job_requirements: str,
+    max_retries: int = 3,
+    cache_dir: Path | None = None,
+) -> SummaryResponse:
+    """Summarize all PRs into high-level bullet points with citations, grouped by job requirements areas.
+    
+    If cache_dir is set, a response cached there for the identical prompt is reused.
+    """
+    prs_text = format_prs_for_prompt(prs)
+    # Built once up front rather than on every attempt, for validating cited URLs
+    all_urls = frozenset(pr.url for pr in prs)
+
+    # Static instructions and job requirements go first so repeated calls share a cacheable prefix
+    system_prompt = get_summarize_system_prompt(job_requirements)
+    user_prompt = get_summarize_user_prompt(
+        num_prs=len(prs),
+        year=year,
+        prs_text=prs_text,
+    )
+
+    def parse(content: str) -> SummaryResponse:
+        # Parse JSON response into Pydantic model
+        summary = SummaryResponse.model_validate_json(content)
+        _validate_citations(summary.bullets, all_urls)
+        return summary
+
+    return _create_structured_completion(
+        client, system_prompt, user_prompt, _SUMMARY_RESPONSE_FORMAT, parse, max_retries,
+        cache_dir=cache_dir,
+    )
+
+
+def generate_batched_summaries(
+    client: OpenAI,
+    groups: dict[str, list[PullRequest]],
+    year: int,
+    job_requirements: str,
+    max_retries: int = 3,
+    cache_dir: Path | None = None,
+) -> dict[str, SummaryResponse]:
+    """Summarize several label groups in a single LLM call.
+    
+    Batching small groups means the job requirements prefix and per-request
+    overhead are paid once per batch instead of once per label. A single
+    group is summarized with generate_summary. If the response is cut off
+    at the token limit, the batch is split in half and each half retried. If
+    cache_dir is set, a response cached there for the identical prompt is reused.
+    
+    Returns:
+        Mapping of label to its summary
+    """
+    if len(groups) == 1:
+        (label, prs), = groups.items()
+        return {label: generate_summary(client, prs, year, job_requirements, max_retries, cache_dir)}
+
+    # Each label may only cite PRs from its own group
+    urls_by_label = {label: frozenset(pr.url for pr in prs) for label, prs in groups.items()}
+    groups_text = "\n".join(
+        f"# LABEL: {label}\n{format_prs_for_prompt(prs)}\n" for label, prs in groups.items()
+    )
+
+    system_prompt = get_summarize_system_prompt(job_requirements)
+    user_prompt = get_batched_summarize_user_prompt(
+        num_groups=len(groups),
+        year=year,
+        groups_text=groups_text,
+    )
+
+    def parse(content: str) -> dict[str, SummaryResponse]:
+        batched = BatchedSummaryResponse.model_validate_json(content)
+        summaries = {
+            summary.label: SummaryResponse(bullets=summary.bullets) for summary in batched.summaries
+        }
+        unexpected = summaries.keys() - groups.keys()
+        if unexpected:
+            raise ValueError(f"Batched response has unknown labels: {', '.join(sorted(unexpected))}")
+        missing = groups.keys() - summaries.keys()
+        if missing:
+            raise ValueError(f"Batched response is missing labels: {', '.join(sorted(missing))}")
+        for label, summary in summaries.items():
+            _validate_citations(summary.bullets, urls_by_label[label])
+        return {label: summaries[label] for label in groups}
+
+    try:
+        return _create_structured_completion(
+            client, system_prompt, user_prompt, _BATCHED_SUMMARY_RESPONSE_FORMAT, parse, max_retries,
+            cache_dir=cache_dir,
+        )
+    except TruncatedResponseError:
+        labels = list(groups)
+        half = len(labels) // 2
+        logger.warning(f"Batched response for {len(labels)} labels was truncated; splitting the batch")
+        summaries = {}
+        for part in (labels[:half], labels[half:]):
+            summaries.update(generate_batched_summaries(
+                client, {label: groups[label] for label in part}, year, job_requirements, max_retries, cache_dir
+            ))
+        return summaries
+
+
+_get_pr_fields = operator.itemgetter("title", "description", "url", "merged_at", "labels")
+
+
+def _make_pr(pr: dict) -> PullRequest:
+    """Build a PullRequest from a trusted dict positionally, without ** kwargs unpacking."""
+    return PullRequest(*_get_pr_fields(pr), pr.get("source_repo", ""))
+
+
 def summarize_prs_in_memory(
-    prs: list[dict],
+    prs: list[PullRequest] | list[dict] | bytes,
     year: int,
     openai_api_key: str,
     role_requirements: str,
+    trusted: bool = True,
 ) -> str:
     """
     Summarize PRs in memory without file I/O.
@@ -229,22 +528,35 @@ def summarize_prs_in_memory(
     All PRs are summarized in a single LLM call.
     
     Args:
-        prs: List of PR dictionaries with title, description, url, merged_at, labels, source_repo
+        prs: List of PullRequest models, e.g. as returned by fetch_merged_prs, or
+            dicts dumped from them, or the raw JSON bytes of such a list.
+            Bytes are always validated with the shared list adapter.
         year: The year for the summary
         openai_api_key: OpenAI API key
         role_requirements: Job requirements text
+        trusted: Whether dict input was produced by our own code (e.g. dumped from
+            fetch_merged_prs results). Trusted dicts are passed straight to the
+            PullRequest constructor without validation, so only set this for
+            internally-produced data.
         
     Returns:
         Markdown formatted summary string
     """
+    if isinstance(prs, bytes):
+        prs = PULL_REQUEST_LIST_ADAPTER.validate_json(prs)
+    elif prs and isinstance(prs[0], dict):
+        if trusted:
+            # Internally-produced dicts are already well-formed; skip validation
+            prs = list(map(_make_pr, prs))
+        else:
+            # One list validation call instead of dispatching model_validate per element
+            prs = PULL_REQUEST_LIST_ADAPTER.validate_python(prs)
+
     client = OpenAI(api_key=openai_api_key)
     
-    # Convert dicts to PullRequest objects
-    pr_objects = [PullRequest.model_validate(pr) for pr in prs]
-    
     # Summarize all PRs in a single LLM call
-    logger.info(f"Summarizing {len(pr_objects)} PRs in a single call")
-    summary_response = generate_summary(client, pr_objects, year, role_requirements)
+    logger.info(f"Summarizing {len(prs)} PRs in a single call")
+    summary_response = generate_summary(client, prs, year, role_requirements)
     formatted_summary = format_summary_with_citations(summary_response)
     logger.info("Completed summarization")
     
@@ -275,27 +587,40 @@ def main():
     print("PERFORMANCE SELF-REVIEW SUMMARY")
     print("=" * 60)
 
+    # Labels are packed into as few LLM calls as the batch limits allow (usually one),
+    # so round trips and the job requirements prefix are paid once per batch. Any
+    # remaining batches run concurrently since each is dominated by OpenAI latency.
+    units = pack_label_batches(grouped)
+
     summaries = {}
-    for label, label_prs in sorted(grouped.items()):
-        print(f"\nSummarizing {label} ({len(label_prs)} PRs)...")
-        summary_response = generate_summary(client, label_prs, year, job_requirements)
+    with ThreadPoolExecutor(max_workers=max(1, min(len(units), MAX_SUMMARY_WORKERS))) as executor:
+        futures = []
+        for unit in units:
+            num_prs = sum(len(grouped[label]) for label in unit)
+            print(f"\nSummarizing {', '.join(unit)} ({num_prs} PRs)...")
+            groups = {label: grouped[label] for label in unit}
+            futures.append(executor.submit(
+                generate_batched_summaries, client, groups, year, job_requirements, cache_dir=RESPONSE_CACHE_DIR
+            ))
         
-        # Format summary with citations
-        formatted_summary = format_summary_with_citations(summary_response)
-        summaries[label] = formatted_summary
+        for future in as_completed(futures):
+            for label, summary_response in future.result().items():
+                # Format summary with citations
+                formatted_summary = format_summary_with_citations(summary_response)
+                summaries[label] = formatted_summary
 
-        print(f"\n### {label.upper()} ###")
-        print(formatted_summary)
-        print()
+                print(f"\n### {label.upper()} ###")
+                print(formatted_summary)
+                print()
 
-    # Write summaries to file in project root
+    # Write summaries to file in project root, in label order regardless of completion order
     output_path = Path(__file__).parent.parent / "self_review_summary.md"
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(f"# Performance Self-Review Summary ({year})\n\n")
-        for label, summary in summaries.items():
-            f.write(f"## {label}\n\n")
-            f.write(summary)
-            f.write("\n\n")
+    buf = io.StringIO()
+    buf.write(f"# Performance Self-Review Summary ({year})\n\n")
+    for label, summary in sorted(summaries.items()):
+        buf.write(f"## {label}\n\n{summary}\n\n")
+    # Encode and write the whole document in one go
+    output_path.write_bytes(buf.getvalue().encode("utf-8"))
 
     print(f"\nSummaries written to {output_path}")
 
@@ -21,6 +21,11 @@ const DEFAULT_ROLE_REQUIREMENTS = `# Job Requirements
 - Contributes to a positive team culture
 `;
 
+// How often to poll a background summary job
+const JOB_POLL_INTERVAL_MS = 2000;
+// Give up on a job that has not finished after this long, e.g. one lost on a server restart
+const JOB_MAX_WAIT_MS = 10 * 60 * 1000;
+
 function App() {
   // Auth state - simple gate
   const [auth, setAuth] = useState(null);
@@ -100,6 +105,28 @@ function App() {
     });
   };
 
+  // Poll a background summary job until it finishes or JOB_MAX_WAIT_MS passes;
+  // resolves to the final job payload
+  const pollJob = async (jobId) => {
+    const deadline = Date.now() + JOB_MAX_WAIT_MS;
+    while (Date.now() < deadline) {
+      await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+      const response = await fetch(`/api/jobs/${jobId}`, {
+        headers: {
+          'Authorization': 'Basic ' + btoa(auth.username + ':' + auth.password),
+        },
+      });
+      const data = await response.json();
+      if (response.status !== 202) {
+        return response.ok ? data : { status: 'error', error: data.error };
+      }
+    }
+    return {
+      status: 'error',
+      error: `Summary generation did not finish within ${JOB_MAX_WAIT_MS / 60000} minutes. Please try again.`,
+    };
+  };
+
   const handleSubmit = async (e) => {
     e.preventDefault();
     
@@ -147,10 +174,17 @@ function App() {
         return;
       }
 
-      if (response.ok) {
-        setSummary(data.summary);
-      } else {
+      if (!response.ok) {
         setError(data.error || 'Failed to generate summary');
+        return;
+      }
+
+      // Summary generation runs as a background job; poll until it finishes
+      const result = await pollJob(data.job_id);
+      if (result.status === 'done') {
+        setSummary(result.summary);
+      } else {
+        setError(result.error || 'Failed to generate summary');
       }
     } catch (err) {
       console.error('Request error:', err);